@@ -62,9 +62,26 @@ def validate(  # pylint: disable=dangerous-default-value
             "--skip", "-s", help="Files to skip during validation.", callback=validate_paths_exist
         ),
     ] = [],
+    jobs: Annotated[
+        int,
+        typer.Option(
+            "--jobs", "-j", min=1, help="Number of worker processes to use for validation."
+        ),
+    ] = 1,
+    recursive: Annotated[
+        bool,
+        typer.Option("--recursive/--no-recursive", help="Search source directories recursively."),
+    ] = True,
+    use_cache: Annotated[
+        bool,
+        typer.Option(
+            "--cache/--no-cache",
+            help="Skip re-validating programs that passed validation in a previous run.",
+        ),
+    ] = False,
 ):
     """Validate OpenQASM files."""
-    validate_qasm(src_paths, skip_files)
+    validate_qasm(src_paths, skip_files, jobs, recursive, use_cache)
 
 
 @app.command(name="unroll", help="Unroll OpenQASM files.")
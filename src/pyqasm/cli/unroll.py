@@ -30,7 +30,7 @@ from rich.console import Console
 from pyqasm import dumps, load
 from pyqasm.exceptions import QasmParsingError, UnrollError, ValidationError
 
-from .utils import skip_qasm_files_with_tag
+from .utils import error_category, skip_qasm_files_with_tag
 
 logger = logging.getLogger(__name__)
 logger.propagate = False
@@ -158,11 +158,7 @@ def unroll_qasm(
 
     if failed_files:
         for file, err, raw_stderr in failed_files:
-            category = (
-                "".join(["-" + c.lower() if c.isupper() else c for c in type(err).__name__])
-                .lstrip("-")
-                .removesuffix("-error")
-            )
+            category = error_category(type(err).__name__)
             # pylint: disable-next=anomalous-backslash-in-string
             console.print("-" * 100)
             console.print(f"Failed to unroll: {file}", "\n")
@@ -17,22 +17,70 @@ Module containing utility functions for the CLI scripts
 
 """
 
+import re
+from functools import lru_cache
+from typing import AnyStr
 
-def skip_qasm_files_with_tag(content: str, mode: str) -> bool:
+_CAMEL_CASE_BOUNDARY = re.compile(r"(?<!^)(?=[A-Z])")
+
+# Line boundaries recognised by str.splitlines, and their UTF-8 encodings
+_LINE_BREAK = re.compile(r"[\n\r\v\f\x1c-\x1e\x85\u2028\u2029]")
+_LINE_BREAK_BYTES = re.compile(rb"[\n\r\v\f\x1c-\x1e]|\xc2\x85|\xe2\x80[\xa8\xa9]")
+
+
+@lru_cache(maxsize=None)
+def error_category(exc_name: str) -> str:
+    """Returns the kebab-case category of an exception type, e.g. 'validation' for
+    ValidationError. Cached since only a handful of exception types are ever reported.
+
+    Args:
+        exc_name (str): The name of the exception type.
+
+    Returns:
+        str: The category name without the '-error' suffix.
+    """
+    return _CAMEL_CASE_BOUNDARY.sub("-", exc_name).lower().removesuffix("-error")
+
+
+@lru_cache(maxsize=None)
+def _skip_tag_pattern(mode: str) -> re.Pattern[str]:
+    """Returns the compiled pattern matching the skip tags for the given mode."""
+    return re.compile(rf"// pyqasm(?: disable: {re.escape(mode)}|: ignore)")
+
+
+@lru_cache(maxsize=None)
+def _skip_tag_pattern_bytes(mode: str) -> re.Pattern[bytes]:
+    """Returns the compiled pattern matching the skip tags for the given mode in raw bytes."""
+    return re.compile(_skip_tag_pattern(mode).pattern.encode("utf-8"))
+
+
+def _version_header(content: AnyStr, marker: AnyStr, line_break: re.Pattern[AnyStr]) -> AnyStr:
+    """Returns the content up to the end of the line containing the version statement."""
+    start = content.find(marker)
+    if start == -1:
+        return content
+    end = line_break.search(content, start)
+    return content if end is None else content[: end.start()]
+
+
+def skip_qasm_files_with_tag(content: str | bytes, mode: str) -> bool:
     """Check if a file should be skipped for a given mode (e.g., 'unroll', 'validate').
 
     Args:
-        content (str): The file content.
+        content (str | bytes): The file content, either decoded or as raw UTF-8 bytes.
         mode (str): The operation mode ('unroll', 'validate', etc.)
 
     Returns:
         bool: True if the file should be skipped, False otherwise.
     """
-    skip_tag = f"// pyqasm disable: {mode}"
-    generic_skip_tag = "// pyqasm: ignore"
-    for line in content.splitlines():
-        if skip_tag in line or generic_skip_tag in line:
-            return True
-        if "OPENQASM" in line:
-            break
-    return False
+    # Skip tags are only honoured up to (and including) the line of the version statement.
+    # Most files carry no tag at all, which a plain substring search rules out cheaply.
+    if isinstance(content, bytes):
+        if b"pyqasm" not in content:
+            return False
+        raw_header = _version_header(content, b"OPENQASM", _LINE_BREAK_BYTES)
+        return _skip_tag_pattern_bytes(mode).search(raw_header) is not None
+    if "pyqasm" not in content:
+        return False
+    header = _version_header(content, "OPENQASM", _LINE_BREAK)
+    return _skip_tag_pattern(mode).search(header) is not None
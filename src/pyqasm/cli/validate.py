@@ -17,28 +17,78 @@ Script to verify OpenQASM files
 
 """
 
+import hashlib
+import importlib.metadata
 import logging
+import multiprocessing
 import os
-from typing import Optional
+import stat
+from collections import deque
+from concurrent.futures import Executor, ThreadPoolExecutor
+from functools import lru_cache, partial
+from itertools import islice, starmap
+from typing import AbstractSet, Iterable, Iterator, Optional
 
 import typer
 from rich.console import Console
+from rich.text import Text
 
-from pyqasm import load
+import pyqasm
+from pyqasm import __version__, loads
 from pyqasm.exceptions import QasmParsingError, UnrollError, ValidationError
+from pyqasm.preprocess import process_include_statements
 
-from .utils import skip_qasm_files_with_tag
+from .utils import error_category, skip_qasm_files_with_tag
 
 logger = logging.getLogger(__name__)
 logger.propagate = False
 
+# Directories that never hold user programs and are not descended into
+_PRUNED_DIRS = frozenset({".git", "__pycache__", ".venv", "node_modules", ".tox"})
+
+# Number of bytes read up front to look for skip tags, which live in the file header
+_HEADER_SIZE = 8192
+
+# Number of threads prefetching file contents when validating in a single process
+_READ_WORKERS = 8
+
+# Maximum number of files read ahead of the one being validated
+_READ_AHEAD = 32
+
+# Number of files handed to a worker process at a time
+_CHUNK_SIZE = 8
+
+# File holding the digests of programs that passed validation in previous runs
+_CACHE_FILE = "validate-cache"
+
+# Version of the cache entry format, bumped whenever the cache key changes
+_CACHE_FORMAT = 1
+
+# Distributions whose code decides whether a program is valid
+_CACHE_DEPENDENCIES = ("openqasm3", "antlr4-python3-runtime")
+
+# Maximum number of entries kept in the validation cache file
+_CACHE_MAX_ENTRIES = 100_000
+
+# Digests of previously validated programs, set once in each worker process
+_worker_digests: AbstractSet[str] = frozenset()
+
+# (file path, validation error or None, skipped by tag, digest to cache or None)
+_Result = tuple[str, Optional[Exception], bool, Optional[str]]
+
 
 def validate_paths_exist(paths: Optional[list[str]]) -> Optional[list[str]]:
     """Verifies that each path in the provided list exists."""
     if not paths:
         return []
 
-    non_existent_paths = [path for path in paths if not os.path.exists(path)]
+    non_existent_paths = []
+    for path in paths:
+        try:
+            os.stat(path)
+        except OSError:
+            non_existent_paths.append(path)
+
     if non_existent_paths:
         if len(non_existent_paths) == 1:
             raise typer.BadParameter(f"Path '{non_existent_paths[0]}' does not exist")
@@ -48,75 +98,280 @@ def validate_paths_exist(paths: Optional[list[str]]) -> Optional[list[str]]:
     return paths
 
 
+def _cache_path() -> str:
+    """Returns the path of the validation cache file."""
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(cache_home, "pyqasm", _CACHE_FILE)
+
+
+def _installed_version(distribution: str) -> str:
+    """Returns the installed version of a distribution, or 'none' if it is missing."""
+    try:
+        return importlib.metadata.version(distribution)
+    except importlib.metadata.PackageNotFoundError:
+        return "none"
+
+
+@lru_cache(maxsize=None)
+def _cache_key() -> str:
+    """Returns the key under which this installation records validated programs.
+
+    Besides the pyqasm version, the key covers the parser versions and the size and
+    modification time of every pyqasm source file, so that upgrading a parser or editing
+    an editable install never reuses results from a different validator.
+    """
+    source = hashlib.blake2b(digest_size=8)
+    for root, dirs, files in os.walk(os.path.dirname(pyqasm.__file__)):
+        dirs.sort()
+        for name in sorted(files):
+            if name.endswith(".py"):
+                info = os.stat(os.path.join(root, name))
+                source.update(f"{name}:{info.st_size}:{info.st_mtime_ns};".encode("utf-8"))
+
+    versions = [__version__, *map(_installed_version, _CACHE_DEPENDENCIES)]
+    return f"v{_CACHE_FORMAT}/{'/'.join(versions)}/{source.hexdigest()}"
+
+
+def _load_cache() -> frozenset[str]:
+    """Loads the digests of programs validated by this installation of pyqasm.
+
+    Entries recorded under another cache key can never match again, so the file is
+    rewritten without them, keeping at most the ``_CACHE_MAX_ENTRIES`` most recent entries.
+    """
+    path = _cache_path()
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            lines = f.read().splitlines()
+    except OSError:
+        return frozenset()
+
+    prefix = f"{_cache_key()} "
+    current = [line for line in lines if line.startswith(prefix)][-_CACHE_MAX_ENTRIES:]
+    if len(current) != len(lines):
+        try:
+            with open(path, "w", encoding="utf-8") as f:
+                f.writelines(f"{line}\n" for line in current)
+        except OSError as err:
+            logger.debug("Could not prune validation cache %s", path, exc_info=err)
+    return frozenset(line[len(prefix) :] for line in current)
+
+
+def _update_cache(digests: Iterable[str]) -> None:
+    """Appends the digests of newly validated programs to the cache."""
+    entries = sorted(digests)
+    if not entries:
+        return
+    path = _cache_path()
+    key = _cache_key()
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "a", encoding="utf-8") as f:
+            f.writelines(f"{key} {digest}\n" for digest in entries)
+    except OSError as err:
+        logger.debug("Could not write validation cache %s", path, exc_info=err)
+
+
+def _program_digest(program: str) -> str:
+    """Returns the cache key of an include-resolved program."""
+    return hashlib.blake2b(program.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _read_source(file_path: str) -> Optional[str]:
+    """Reads an OpenQASM file, returning None if it is tagged to be skipped."""
+    # skip tags are matched on the raw bytes so skipped files are never decoded
+    with open(file_path, "rb") as f:
+        header = f.read(_HEADER_SIZE)
+        if skip_qasm_files_with_tag(header, "validate"):
+            return None
+        rest = f.read()
+
+    data = header + rest
+    # the header may have been cut off before the OPENQASM line was reached
+    if rest and skip_qasm_files_with_tag(data, "validate"):
+        return None
+    return data.decode("utf-8")
+
+
+def _read_ahead(
+    executor: Executor, file_paths: Iterable[str]
+) -> Iterator[tuple[str, Optional[str]]]:
+    """Yields each file path with its source, in order, keeping a bounded number of
+    reads in flight so memory use does not grow with the number of files."""
+    paths = iter(file_paths)
+    in_flight = deque(
+        (path, executor.submit(_read_source, path)) for path in islice(paths, _READ_AHEAD)
+    )
+    for path in paths:
+        done_path, future = in_flight.popleft()
+        yield done_path, future.result()
+        in_flight.append((path, executor.submit(_read_source, path)))
+    while in_flight:
+        done_path, future = in_flight.popleft()
+        yield done_path, future.result()
+
+
+def _validate_source(
+    file_path: str, content: Optional[str], valid_digests: AbstractSet[str] = frozenset()
+) -> _Result:
+    """Validates the already-read content of an OpenQASM file.
+
+    Programs whose digest is in ``valid_digests`` passed validation before and
+    are not parsed again.
+
+    Returns:
+        tuple: The file path, the error raised during validation (or None), whether
+            the file was skipped because of a skip tag, and the digest of the program
+            if it was newly found to be valid (or None).
+    """
+    if content is None:
+        return file_path, None, True, None
+
+    try:
+        program = process_include_statements(file_path, content)
+        digest = _program_digest(program)
+        if digest in valid_digests:
+            return file_path, None, False, None
+        module = loads(program)
+        module.validate()
+    except (ValidationError, UnrollError, QasmParsingError) as err:
+        return file_path, err, False, None
+    except Exception as uncaught_err:  # pylint: disable=broad-exception-caught
+        logger.debug("Uncaught error in %s", file_path, exc_info=uncaught_err)
+        return file_path, uncaught_err, False, None
+    return file_path, None, False, digest
+
+
+def _init_worker(valid_digests: AbstractSet[str]) -> None:
+    """Stores the cached digests in a worker process, so they are sent once per
+    worker rather than with every chunk of files."""
+    global _worker_digests  # pylint: disable=global-statement
+    _worker_digests = valid_digests
+
+
+def _validate_one(file_path: str) -> _Result:
+    """Reads and validates a single OpenQASM file.
+
+    Defined at module level so that it can be dispatched to worker processes.
+    """
+    return _validate_source(file_path, _read_source(file_path), _worker_digests)
+
+
 # pylint: disable-next=too-many-locals,too-many-statements
-def validate_qasm(src_paths: list[str], skip_files: Optional[list[str]] = None) -> None:
-    """Script validate OpenQASM files"""
-    skip_files = skip_files or []
+def validate_qasm(
+    src_paths: list[str],
+    skip_files: Optional[list[str]] = None,
+    jobs: int = 1,
+    recursive: bool = True,
+    use_cache: bool = False,
+) -> None:
+    """Script validate OpenQASM files
 
-    failed_files: list[tuple[str, Exception]] = []
+    With ``use_cache``, programs that passed validation in a previous run with the same
+    pyqasm installation are not parsed again. The cache is off by default.
+    """
+    skipped = {os.path.realpath(file_path) for file_path in skip_files or ()}
+    valid_digests = _load_cache() if use_cache else frozenset()
+    new_digests: set[str] = set()
 
     console = Console()
 
-    def validate_qasm_file(file_path: str) -> None:
-        with open(file_path, "r", encoding="utf-8") as f:
-            content = f.read()
+    def process_files_in_directory(directory: str) -> Iterator[str]:
+        # DirEntry caches the file type reported by the directory listing,
+        # so this avoids the extra stat call and path join os.walk does per entry.
+        # Directories are visited breadth-first, so parents come before their children.
+        # Like os.walk, unreadable directories are skipped, symlinked files are validated
+        # and symlinked directories are not descended into.
+        queue = deque([directory])
+        while queue:
+            try:
+                entries = os.scandir(queue.popleft())
+            except OSError:
+                continue
+            with entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if recursive and entry.name not in _PRUNED_DIRS:
+                            queue.append(entry.path)
+                    elif entry.name.endswith(".qasm") and entry.is_file():
+                        yield entry.path
 
-        if file_path in skip_files:
-            return
-        if skip_qasm_files_with_tag(content, "validate"):
-            skip_files.append(file_path)
-            return
+    def collect_results(results: Iterable[_Result]) -> int:
+        # errors are reported as soon as they are available rather than buffered
+        num_failed = 0
+        for file_path, err, tagged, digest in results:
+            if tagged:
+                skipped.add(os.path.realpath(file_path))
+            elif digest is not None:
+                new_digests.add(digest)
+            elif err is not None:
+                category = error_category(type(err).__name__)
+                # assembled from styled segments so rich does not parse the message as markup
+                console.print(
+                    Text.assemble(
+                        f"{file_path}: ", ("error:", "red"), f" {err} ", (f"[{category}]", "yellow")
+                    )
+                )
+                num_failed += 1
+        return num_failed
 
-        try:
-            module = load(file_path)
-            module.validate()
-        except (ValidationError, UnrollError, QasmParsingError) as err:
-            failed_files.append((file_path, err))
-        except Exception as uncaught_err:  # pylint: disable=broad-exception-caught
-            logger.debug("Uncaught error in %s", file_path, exc_info=uncaught_err)
-            failed_files.append((file_path, uncaught_err))
-
-    def process_files_in_directory(directory: str) -> int:
-        count = 0
-        if not os.path.isdir(directory):
-            return count
-        for root, _, files in os.walk(directory):
-            for file in files:
-                if file.endswith(".qasm"):
-                    file_path = os.path.join(root, file)
-                    validate_qasm_file(file_path)
-                    count += 1
-        return count
-
-    checked = 0
-    for item in src_paths:
-        if os.path.isdir(item):
-            checked += process_files_in_directory(item)
-        elif os.path.isfile(item) and item.endswith(".qasm"):
-            validate_qasm_file(item)
-            checked += 1
-
-    checked -= len(skip_files)
+    num_candidates = 0
+
+    def iter_pending() -> Iterator[str]:
+        # files are produced lazily so that walking large trees overlaps with validation
+        nonlocal num_candidates
+        seen: set[str] = set()
+        for item in src_paths:
+            try:
+                mode = os.stat(item).st_mode
+            except OSError:
+                continue
+            if stat.S_ISDIR(mode):
+                candidates: Iterable[str] = process_files_in_directory(item)
+            elif stat.S_ISREG(mode) and item.endswith(".qasm"):
+                candidates = (item,)
+            else:
+                continue
+            for file_path in candidates:
+                # canonical paths make overlapping source paths validate each file once
+                real_path = os.path.realpath(file_path)
+                if real_path in seen:
+                    continue
+                seen.add(real_path)
+                num_candidates += 1
+                if real_path not in skipped:
+                    yield file_path
+
+    num_failed = 0
+    if jobs > 1:
+        with multiprocessing.Pool(
+            processes=jobs, initializer=_init_worker, initargs=(valid_digests,)
+        ) as pool:
+            num_failed = collect_results(
+                pool.imap_unordered(_validate_one, iter_pending(), chunksize=_CHUNK_SIZE)
+            )
+    else:
+        # read files on background threads while the main thread parses
+        with ThreadPoolExecutor(max_workers=_READ_WORKERS) as executor:
+            validate_source = partial(_validate_source, valid_digests=valid_digests)
+            num_failed = collect_results(
+                starmap(validate_source, _read_ahead(executor, iter_pending()))
+            )
+
+    if use_cache:
+        _update_cache(new_digests - valid_digests)
+
+    checked = num_candidates - len(skipped)
 
     if checked == 0:
         console.print("No .qasm files present. Nothing to do.")
         raise typer.Exit(0)
 
-    if skip_files:
-        skiped = "" if len(skip_files) == 1 else "s"
-        console.print(f"[yellow]Skipped {len(skip_files)} file{skiped}[/yellow]")
+    if skipped:
+        skiped = "" if len(skipped) == 1 else "s"
+        console.print(f"[yellow]Skipped {len(skipped)} file{skiped}[/yellow]")
 
     s_checked = "" if checked == 1 else "s"
-    if failed_files:
-        for file, err in failed_files:
-            category = (
-                "".join(["-" + c.lower() if c.isupper() else c for c in type(err).__name__])
-                .lstrip("-")
-                .removesuffix("-error")
-            )
-            # pylint: disable-next=anomalous-backslash-in-string
-            console.print(f"{file}: [red]error:[/red] {err} [yellow]\[{category}][/yellow]")
-        num_failed = len(failed_files)
+    if num_failed:
         s1 = "" if num_failed == 1 else "s"
         console.print(
             f"[red]Found errors in {num_failed} file{s1} "
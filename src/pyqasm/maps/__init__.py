@@ -30,13 +30,18 @@ from openqasm3.ast import (
 
 # Reference : https://openqasm.com/language/classical.html#the-switch-statement
 # Paragraph 14
-SWITCH_BLACKLIST_STMTS = {
-    QubitDeclaration,
-    ClassicalDeclaration,
-    SubroutineDefinition,
-    QuantumGateDefinition,
-}
+SWITCH_BLACKLIST_STMTS = frozenset(
+    {
+        QubitDeclaration,
+        ClassicalDeclaration,
+        SubroutineDefinition,
+        QuantumGateDefinition,
+    }
+)
 
 SUPPORTED_QASM_VERSIONS = {"3.0", "3", "2", "2.0"}
 
 QUANTUM_STATEMENTS = (QuantumGate, QuantumBarrier, QuantumReset, QuantumMeasurementStatement)
+
+# Exact-type lookup for hot loops over AST statements; none of these node types is subclassed
+QUANTUM_STATEMENT_TYPES = frozenset(QUANTUM_STATEMENTS)
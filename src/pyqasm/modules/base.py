@@ -20,8 +20,9 @@ from __future__ import annotations
 
 import functools
 from abc import ABC, abstractmethod
-from collections import Counter
+from collections import Counter, defaultdict
 from copy import deepcopy
+from dataclasses import replace
 from typing import Optional
 
 import openqasm3.ast as qasm3_ast
@@ -31,7 +32,7 @@ from pyqasm.analyzer import Qasm3Analyzer
 from pyqasm.decomposer import Decomposer
 from pyqasm.elements import ClbitDepthNode, QubitDepthNode
 from pyqasm.exceptions import UnrollError, ValidationError
-from pyqasm.maps import QUANTUM_STATEMENTS
+from pyqasm.maps import QUANTUM_STATEMENT_TYPES
 from pyqasm.maps.decomposition_rules import DECOMPOSITION_RULES
 from pyqasm.visitor import QasmVisitor, ScopeManager
 
@@ -81,10 +82,17 @@ class QasmModule(ABC):  # pylint: disable=too-many-instance-attributes, too-many
         self._clbit_depths: dict[tuple[str, int], ClbitDepthNode] = {}
         self._qubit_registers: dict[str, int] = {}
         self._classical_registers: dict[str, int] = {}
-        self._has_measurements: Optional[bool] = None
-        self._has_barriers: Optional[bool] = None
+        # incremented whenever the statement lists change, to invalidate the cached scans below
+        self._statements_version = 0
+        # (statements version, result) of the last has_measurements / has_barriers scan
+        self._has_measurements: Optional[tuple[int, bool]] = None
+        self._has_barriers: Optional[tuple[int, bool]] = None
+        # (statements version, depth) keyed by the arguments the depth was computed with
+        self._depth_cache: dict[tuple[bool, tuple[str, ...]], tuple[int, int]] = {}
         self._validated_program = False
         self._unrolled_ast = Program(statements=[])
+        # whether the unrolled AST holds the current program
+        self._unrolled = False
         self._external_gates: list[str] = []
         self._decompose_native_gates: Optional[bool] = None
         self._device_qubits: Optional[int] = None
@@ -171,23 +179,41 @@ class QasmModule(ABC):  # pylint: disable=too-many-instance-attributes, too-many
     def unrolled_ast(self, value: Program):
         """Setter for the unrolled AST"""
         self._unrolled_ast = value
+        self._unrolled = True
+        self._statements_version += 1
+
+    def _active_statements(self) -> list[qasm3_ast.Statement | qasm3_ast.Pragma]:
+        """Returns the unrolled statements if the module has been unrolled, otherwise
+        the statements of the original program."""
+        if self._unrolled:
+            return self._unrolled_ast.statements
+        return self._statements
+
+    def _replace_statements(self, statements: list[qasm3_ast.Statement | qasm3_ast.Pragma]) -> None:
+        """Makes the given statements both the unrolled program and the input of any
+        later unroll, sharing a single list between the two."""
+        self._statements = statements
+        self._unrolled_ast.statements = statements
+        self._unrolled = True
+        self._statements_version += 1
+
+    def _statements_without(
+        self, stmt_types: tuple[type, ...]
+    ) -> list[qasm3_ast.Statement | qasm3_ast.Pragma]:
+        """Returns the active statements, leaving out those of the given types."""
+        return [stmt for stmt in self._active_statements() if not isinstance(stmt, stmt_types)]
 
     def has_measurements(self) -> bool:
         """Check if the module has any measurement operations."""
-        if self._has_measurements is None:
-            self._has_measurements = False
+        if self._has_measurements is None or self._has_measurements[0] != self._statements_version:
             # try to check in the unrolled version as that will a better indicator of
             # the presence of measurements
-            stmts_to_check = (
-                self._unrolled_ast.statements
-                if len(self._unrolled_ast.statements) > 0
-                else self._statements
+            found = any(
+                isinstance(stmt, qasm3_ast.QuantumMeasurementStatement)
+                for stmt in self._active_statements()
             )
-            for stmt in stmts_to_check:
-                if isinstance(stmt, qasm3_ast.QuantumMeasurementStatement):
-                    self._has_measurements = True
-                    break
-        return self._has_measurements
+            self._has_measurements = (self._statements_version, found)
+        return self._has_measurements[1]
 
     @track_user_operation
     def remove_measurements(self, in_place: bool = True) -> Optional["QasmModule"]:
@@ -199,16 +225,7 @@ class QasmModule(ABC):  # pylint: disable=too-many-instance-attributes, too-many
         Returns:
             QasmModule: The module with the measurements removed if in_place is False
         """
-        stmt_list = (
-            self._statements
-            if len(self._unrolled_ast.statements) == 0
-            else self._unrolled_ast.statements
-        )
-        stmts_without_meas = [
-            stmt
-            for stmt in stmt_list
-            if not isinstance(stmt, qasm3_ast.QuantumMeasurementStatement)
-        ]
+        stmts_without_meas = self._statements_without((qasm3_ast.QuantumMeasurementStatement,))
         curr_module = self
 
         if not in_place:
@@ -219,9 +236,8 @@ class QasmModule(ABC):  # pylint: disable=too-many-instance-attributes, too-many
         for clbit in curr_module._clbit_depths.values():
             clbit.num_measurements = 0
 
-        curr_module._has_measurements = False
-        curr_module._statements = stmts_without_meas
-        curr_module._unrolled_ast.statements = stmts_without_meas
+        curr_module._replace_statements(stmts_without_meas)
+        curr_module._has_measurements = (curr_module._statements_version, False)
 
         return curr_module
 
@@ -234,20 +250,14 @@ class QasmModule(ABC):  # pylint: disable=too-many-instance-attributes, too-many
         Returns:
             bool: True if the module has barrier operations, False otherwise
         """
-        if self._has_barriers is None:
-            self._has_barriers = False
+        if self._has_barriers is None or self._has_barriers[0] != self._statements_version:
             # try to check in the unrolled version as that will a better indicator of
             # the presence of barriers
-            stmts_to_check = (
-                self._unrolled_ast.statements
-                if len(self._unrolled_ast.statements) > 0
-                else self._statements
+            found = any(
+                isinstance(stmt, qasm3_ast.QuantumBarrier) for stmt in self._active_statements()
             )
-            for stmt in stmts_to_check:
-                if isinstance(stmt, qasm3_ast.QuantumBarrier):
-                    self._has_barriers = True
-                    break
-        return self._has_barriers
+            self._has_barriers = (self._statements_version, found)
+        return self._has_barriers[1]
 
     @track_user_operation
     def remove_barriers(self, in_place: bool = True) -> Optional["QasmModule"]:
@@ -259,14 +269,7 @@ class QasmModule(ABC):  # pylint: disable=too-many-instance-attributes, too-many
         Returns:
             QasmModule: The module with the barriers removed if in_place is False
         """
-        stmt_list = (
-            self._statements
-            if len(self._unrolled_ast.statements) == 0
-            else self._unrolled_ast.statements
-        )
-        stmts_without_barriers = [
-            stmt for stmt in stmt_list if not isinstance(stmt, qasm3_ast.QuantumBarrier)
-        ]
+        stmts_without_barriers = self._statements_without((qasm3_ast.QuantumBarrier,))
         curr_module = self
         if not in_place:
             curr_module = self.copy()
@@ -274,9 +277,8 @@ class QasmModule(ABC):  # pylint: disable=too-many-instance-attributes, too-many
         for qubit in curr_module._qubit_depths.values():
             qubit.num_barriers = 0
 
-        curr_module._has_barriers = False
-        curr_module._statements = stmts_without_barriers
-        curr_module._unrolled_ast.statements = stmts_without_barriers
+        curr_module._replace_statements(stmts_without_barriers)
+        curr_module._has_barriers = (curr_module._statements_version, False)
 
         return curr_module
 
@@ -290,20 +292,12 @@ class QasmModule(ABC):  # pylint: disable=too-many-instance-attributes, too-many
         Returns:
             QasmModule: The module with the includes removed if in_place is False, None otherwise
         """
-        stmt_list = (
-            self._statements
-            if len(self._unrolled_ast.statements) == 0
-            else self._unrolled_ast.statements
-        )
-        stmts_without_includes = [
-            stmt for stmt in stmt_list if not isinstance(stmt, qasm3_ast.Include)
-        ]
+        stmts_without_includes = self._statements_without((qasm3_ast.Include,))
         curr_module = self
         if not in_place:
             curr_module = self.copy()
 
-        curr_module._statements = stmts_without_includes
-        curr_module._unrolled_ast.statements = stmts_without_includes
+        curr_module._replace_statements(stmts_without_includes)
 
         return curr_module
 
@@ -323,27 +317,44 @@ class QasmModule(ABC):  # pylint: disable=too-many-instance-attributes, too-many
         # calculate the depth of the unrolled program.
 
         # We are performing operations in place, thus we need to calculate depth
-        # at "each instance of the function call".
-        # TODO: optimize by tracking whether the program changed since we
-        # last calculated the depth
-
-        qasm_module = self.copy()
-        qasm_module._qubit_depths = {}
-        qasm_module._clbit_depths = {}
-        qasm_module._decompose_native_gates = decompose_native_gates
-        # Unroll using any external gates that have been recorded for this
-        # module
-        qasm_module.unroll(external_gates=self._external_gates)
-
-        max_depth = 0
-        max_qubit_depth, max_clbit_depth = 0, 0
-
-        # calculate the depth using the qubit and clbit depths
-        if len(qasm_module._qubit_depths) != 0:
-            max_qubit_depth = max(qubit.depth for qubit in qasm_module._qubit_depths.values())
-        if len(qasm_module._clbit_depths) != 0:
-            max_clbit_depth = max(clbit.depth for clbit in qasm_module._clbit_depths.values())
-        max_depth = max(max_qubit_depth, max_clbit_depth)
+        # at "each instance of the function call", unless the program is unchanged
+        # since the depth was last calculated with the same arguments.
+        cache_key = (decompose_native_gates, tuple(self._external_gates))
+        cached = self._depth_cache.get(cache_key)
+        if cached is not None and cached[0] == self._statements_version:
+            return cached[1]
+
+        # Rather than unrolling a full copy of the module, unroll in place on fresh
+        # bookkeeping state and restore the original state afterwards. Only the
+        # input statements are copied, as the visitor rewrites some of them in place.
+        saved_state = self.__dict__.copy()
+        self._statements = deepcopy(self._statements)
+        self._qubit_depths = {}
+        self._clbit_depths = {}
+        self._qubit_registers = dict(self._qubit_registers)
+        self._classical_registers = dict(self._classical_registers)
+        self._extern_functions = dict(self._extern_functions)
+        self._user_operations = list(self._user_operations)
+        self._unrolled_ast = Program(statements=[], version=self._unrolled_ast.version)
+        self._decompose_native_gates = decompose_native_gates
+        try:
+            # Unroll using any external gates that have been recorded for this
+            # module
+            self.unroll(external_gates=self._external_gates)
+
+            # calculate the depth using the qubit and clbit depths
+            max_depth = max(
+                (
+                    node.depth
+                    for depth_map in (self._qubit_depths, self._clbit_depths)
+                    for node in depth_map.values()
+                ),
+                default=0,
+            )
+        finally:
+            self.__dict__.update(saved_state)
+
+        self._depth_cache[cache_key] = (self._statements_version, max_depth)
         return max_depth
 
     def _remap_qubits(self, reg_name: str, size: int, idle_indices: list[int]):
@@ -369,16 +380,18 @@ class QasmModule(ABC):  # pylint: disable=too-many-instance-attributes, too-many
                     stmt.size.value = new_size  # type: ignore[union-attr]
                     break
 
-        # update the qubit depths
+        # update the qubit depths, re-keying the existing nodes through a separate map so
+        # that an entry is never overwritten or deleted before it has been moved
+        remapped_depths = {}
         for idx in used_indices:
-            qubit = self._qubit_depths[(reg_name, idx)]
+            qubit = self._qubit_depths.pop((reg_name, idx))
             qubit.reg_index = idx_map[idx]
-            self._qubit_depths[(reg_name, idx_map[idx])] = deepcopy(qubit)
-            del self._qubit_depths[(reg_name, idx)]
+            remapped_depths[(reg_name, qubit.reg_index)] = qubit
+        self._qubit_depths.update(remapped_depths)
 
         # update the operations that use the qubits
         for operation in self._unrolled_ast.statements:
-            if isinstance(operation, QUANTUM_STATEMENTS):
+            if type(operation) in QUANTUM_STATEMENT_TYPES:
                 bit_list = Qasm3Analyzer.get_op_bit_list(operation)
                 for bit in bit_list:
                     assert isinstance(bit, qasm3_ast.IndexedIdentifier)
@@ -393,16 +406,13 @@ class QasmModule(ABC):  # pylint: disable=too-many-instance-attributes, too-many
             dict[str, list[int]]: A dictionary mapping the register name to the list of idle qubit
                                   indices in that register
         """
-        idle_qubits = [qubit for qubit in self._qubit_depths.values() if qubit.is_idle()]
-
-        # re-map the idle qubits as {reg_name: [indices]}
-        qubit_indices: dict[str, list[int]] = {}
-        for qubit in idle_qubits:
-            if qubit.reg_name not in qubit_indices:
-                qubit_indices[qubit.reg_name] = []
-            qubit_indices[qubit.reg_name].append(qubit.reg_index)
+        # map the idle qubits as {reg_name: [indices]}
+        qubit_indices: defaultdict[str, list[int]] = defaultdict(list)
+        for qubit in self._qubit_depths.values():
+            if qubit.is_idle():
+                qubit_indices[qubit.reg_name].append(qubit.reg_index)
 
-        return qubit_indices
+        return dict(qubit_indices)
 
     def populate_idle_qubits(self, in_place: bool = True):
         """Populate the idle qubits in the module with identity gates
@@ -421,29 +431,32 @@ class QasmModule(ABC):  # pylint: disable=too-many-instance-attributes, too-many
         qasm_module.validate()
 
         idle_qubit_indices = qasm_module._get_idle_qubit_indices()
+        if not idle_qubit_indices:
+            return qasm_module
 
-        id_gate_list = []
         for reg_name, idle_indices in idle_qubit_indices.items():
+            # increment the depth of the idle qubits by 1
             for idx in idle_indices:
-                # increment the depth of the idle qubits by 1
                 qasm_module._qubit_depths[(reg_name, idx)].depth += 1
 
-                # add an identity gate to the qubits that are idle
-                id_gate = qasm3_ast.QuantumGate(
-                    modifiers=[],
-                    name=qasm3_ast.Identifier(name="id"),
-                    arguments=[],
-                    qubits=[
-                        qasm3_ast.IndexedIdentifier(
-                            name=qasm3_ast.Identifier(name=reg_name),
-                            indices=[[qasm3_ast.IntegerLiteral(value=idx)]],
-                        )
-                    ],
-                )
-                id_gate_list.append(id_gate)
-
-        qasm_module.original_program.statements.extend(id_gate_list)
+        # add an identity gate to the qubits that are idle
+        qasm_module.original_program.statements.extend(
+            qasm3_ast.QuantumGate(
+                modifiers=[],
+                name=qasm3_ast.Identifier(name="id"),
+                arguments=[],
+                qubits=[
+                    qasm3_ast.IndexedIdentifier(
+                        name=qasm3_ast.Identifier(name=reg_name),
+                        indices=[[qasm3_ast.IntegerLiteral(value=idx)]],
+                    )
+                ],
+            )
+            for reg_name, idle_indices in idle_qubit_indices.items()
+            for idx in idle_indices
+        )
         qasm_module._statements = qasm_module.original_program.statements
+        qasm_module._statements_version += 1
 
         return qasm_module
 
@@ -465,24 +478,17 @@ class QasmModule(ABC):  # pylint: disable=too-many-instance-attributes, too-many
         qasm_module.unroll()
 
         idle_qubit_indices = qasm_module._get_idle_qubit_indices()
+        unused_registers = set()
 
         for reg_name, idle_indices in idle_qubit_indices.items():
             # we have removed the idle qubits, so we can remove them from depth map
             for idle_idx in idle_indices:
                 del qasm_module._qubit_depths[(reg_name, idle_idx)]
 
-            size = self._qubit_registers[reg_name]
+            size = qasm_module._qubit_registers[reg_name]
 
             if len(idle_indices) == size:  # all qubits are idle
-
-                # remove the declaration from the unrolled ast
-                for stmt in qasm_module._unrolled_ast.statements:
-                    if isinstance(stmt, qasm3_ast.QubitDeclaration):
-                        if stmt.qubit.name == reg_name:
-                            qasm_module._unrolled_ast.statements.remove(stmt)
-                            qasm_module._statements.remove(stmt)
-                            break
-
+                unused_registers.add(reg_name)
                 del qasm_module._qubit_registers[reg_name]
                 # we do not need to change any other operation as there will be no qubit usage
                 # if the complete register was unused
@@ -491,11 +497,23 @@ class QasmModule(ABC):  # pylint: disable=too-many-instance-attributes, too-many
                 qasm_module._remap_qubits(reg_name, size, idle_indices)
 
             # update the number of qubits
-            self._num_qubits -= len(idle_indices)
+            qasm_module._num_qubits -= len(idle_indices)
+
+        # remove the declarations of the unused registers from the unrolled ast in one pass
+        statements = qasm_module._unrolled_ast.statements
+        if unused_registers:
+            statements = [
+                stmt
+                for stmt in statements
+                if not (
+                    isinstance(stmt, qasm3_ast.QubitDeclaration)
+                    and stmt.qubit.name in unused_registers
+                )
+            ]
 
         # the original ast will need to be updated to the unrolled ast as if we call the
         # unroll operation again, it will incorrectly choose the original ast WITH THE IDLE QUBITS
-        qasm_module._statements = qasm_module._unrolled_ast.statements
+        qasm_module._replace_statements(statements)
 
         return qasm_module
 
@@ -516,46 +534,28 @@ class QasmModule(ABC):  # pylint: disable=too-many-instance-attributes, too-many
         qasm_module = self if in_place else self.copy()
         qasm_module.unroll()
 
-        new_qubit_mappings = {}
-        for register, size in self._qubit_registers.items():
-            new_qubit_mappings[register] = {0: 0}
-            if size > 1:
-                new_qubit_mappings[register] = {old_id: size - old_id - 1 for old_id in range(size)}
+        new_qubit_mappings = {
+            register: list(range(size - 1, -1, -1))
+            for register, size in self._qubit_registers.items()
+        }
 
         # Example -
         # q[0], q[1], q[2], q[3] -> q[3], q[2], q[1], q[0]
-        # new_qubit_mappings = {"q": {0: 3, 1: 2, 2: 1, 3: 0}}
+        # new_qubit_mappings = {"q": [3, 2, 1, 0]}
 
         # 1. Qubit depths will be recalculated whenever we calculate the depth so we do not update
         #    the depth maps here
 
-        # 2. replace each qubit index in the Quantum Operations with the new index
+        # 2. replace each qubit index in the Quantum Operations with the new index. Every bit
+        #    node belongs to a single operation, so one pass remaps each index exactly once
         for operation in qasm_module._unrolled_ast.statements:
-            if isinstance(operation, QUANTUM_STATEMENTS):
-                bit_list = Qasm3Analyzer.get_op_bit_list(operation)
-                for bit in bit_list:
-                    curr_reg_name = bit.name.name
-                    curr_reg_idx = bit.indices[0][0].value
-                    new_reg_idx = new_qubit_mappings[curr_reg_name][curr_reg_idx]
-
-                    # make the idx -ve so that this is not touched
-                    # while updating the same index later
-
-                    # idx -> -1 * idx - 1 as we also have to look at index 0
-                    # which will remain 0 if we just multiply by -1
-                    bit.indices[0][0].value = -1 * new_reg_idx - 1
-
-        # remove the -ve marker
-        for operation in qasm_module._unrolled_ast.statements:
-            if isinstance(operation, QUANTUM_STATEMENTS):
-                bit_list = Qasm3Analyzer.get_op_bit_list(operation)
-                for bit in bit_list:
-                    if bit.indices[0][0].value < 0:
-                        bit.indices[0][0].value += 1
-                        bit.indices[0][0].value *= -1
+            if type(operation) in QUANTUM_STATEMENT_TYPES:
+                for bit in Qasm3Analyzer.get_op_bit_list(operation):
+                    index = bit.indices[0][0]
+                    index.value = new_qubit_mappings[bit.name.name][index.value]
 
         # 3. update the original AST with the unrolled AST
-        qasm_module._statements = qasm_module._unrolled_ast.statements
+        qasm_module._replace_statements(qasm_module._unrolled_ast.statements)
 
         # 4. return the module
         return qasm_module
@@ -569,6 +569,9 @@ class QasmModule(ABC):  # pylint: disable=too-many-instance-attributes, too-many
             self.num_qubits, self.num_clbits = 0, 0
             visitor = QasmVisitor(self, ScopeManager(), check_only=True)
             self.accept(visitor)
+            # the check-only visit leaves an empty unrolled AST behind
+            self._unrolled = False
+            self._statements_version += 1
             # Implicit validation: check total qubits if device_qubits is set and not consolidating
             if self._device_qubits:
                 if self.num_qubits > self._device_qubits:
@@ -582,19 +585,25 @@ class QasmModule(ABC):  # pylint: disable=too-many-instance-attributes, too-many
         self._validated_program = True
 
     @track_user_operation
-    def unroll(self, **kwargs):
+    def unroll(
+        self,
+        *,
+        external_gates: Optional[list[str]] = None,
+        consolidate_qubits: bool = False,
+        **kwargs,
+    ):
         """Unroll the module into basic qasm operations.
 
         Args:
+            external_gates (list[str]): List of gates that should not be unrolled.
+            consolidate_qubits (bool): If True, consolidate all quantum registers into
+                                       single register.
             **kwargs: Additional arguments to pass to the QasmVisitor.
-                external_gates (list[str]): List of gates that should not be unrolled.
                 unroll_barriers (bool): If True, barriers will be unrolled. Defaults to True.
                 max_loop_iters (int): Max number of iterations for unrolling loops. Defaults to 1e9.
                 check_only (bool): If True, only check the program without executing it.
                                    Defaults to False.
                 device_qubits (int): Number of physical qubits available on the target device.
-                consolidate_qubits (bool): If True, consolidate all quantum registers into
-                                           single register.
 
         Raises:
             ValidationError: If the module fails validation during unrolling.
@@ -604,24 +613,28 @@ class QasmModule(ABC):  # pylint: disable=too-many-instance-attributes, too-many
             This method resets the module's qubit and classical bit counts before unrolling,
             and sets them to -1 if an error occurs during unrolling.
         """
-        if not kwargs:
-            kwargs = {}
-
         try:
             self.num_qubits, self.num_clbits = 0, 0
-            if ext_gates := kwargs.get("external_gates"):
-                self._external_gates = ext_gates
-            else:
-                self._external_gates = []
-            if consolidate_qbts := kwargs.get("consolidate_qubits"):
-                self._consolidate_qubits = consolidate_qbts
-            visitor = QasmVisitor(module=self, scope_manager=ScopeManager(), **kwargs)
+            self._external_gates = external_gates or []
+            if consolidate_qubits:
+                self._consolidate_qubits = consolidate_qubits
+            visitor = QasmVisitor(
+                module=self,
+                scope_manager=ScopeManager(),
+                external_gates=external_gates,
+                consolidate_qubits=consolidate_qubits,
+                **kwargs,
+            )
             self.accept(visitor)
+            self._unrolled = True
         except (ValidationError, UnrollError) as err:
             # reset the unrolled ast and qasm
             self.num_qubits, self.num_clbits = -1, -1
             self._unrolled_ast = Program(statements=[], version=self.original_program.version)
+            self._unrolled = False
             raise err
+        finally:
+            self._statements_version += 1
 
     @track_user_operation
     def rebase(self, target_basis_set, in_place=True):
@@ -641,28 +654,23 @@ class QasmModule(ABC):  # pylint: disable=too-many-instance-attributes, too-many
 
         qasm_module = self if in_place else self.copy()
 
-        if len(qasm_module._unrolled_ast.statements) == 0:
+        if not qasm_module._unrolled:
             qasm_module.unroll()
 
-        rebased_statements = []
+        rebased_statements: list[qasm3_ast.Statement | qasm3_ast.Pragma] = []
+        process_gate = Decomposer.process_gate_statement
+        process_branch = Decomposer.process_branching_statement
 
         for statement in qasm_module._unrolled_ast.statements:
             if isinstance(statement, QuantumGate):
-                gate_name = statement.name.name
-
                 # Decompose the gate
-                processed_gates_list = Decomposer.process_gate_statement(
-                    gate_name, statement, target_basis_set
+                rebased_statements.extend(
+                    process_gate(statement.name.name, statement, target_basis_set)
                 )
-                for processed_gate in processed_gates_list:
-                    rebased_statements.append(processed_gate)
 
             elif isinstance(statement, BranchingStatement):
                 # Recursively process the if_block and else_block
-
-                rebased_statements.append(
-                    Decomposer.process_branching_statement(statement, target_basis_set)
-                )
+                rebased_statements.append(process_branch(statement, target_basis_set))
 
             else:
                 # Non-gate statements are directly appended
@@ -670,6 +678,7 @@ class QasmModule(ABC):  # pylint: disable=too-many-instance-attributes, too-many
 
         # Replace the unrolled AST with the rebased one
         qasm_module._unrolled_ast.statements = rebased_statements
+        qasm_module._statements_version += 1
 
         return qasm_module
 
@@ -679,7 +688,7 @@ class QasmModule(ABC):  # pylint: disable=too-many-instance-attributes, too-many
         Returns:
             dict[str, int]: A dictionary of gate counts.
         """
-        if not self._unrolled_ast.statements:
+        if not self._unrolled:
             self.unroll()
 
         gate_nodes = [
@@ -742,13 +751,35 @@ class QasmModule(ABC):  # pylint: disable=too-many-instance-attributes, too-many
             str: The string representation of the module
         """
 
-        if len(self._unrolled_ast.statements) > 1:
+        if self._unrolled:
             return self._qasm_ast_to_str(self.unrolled_ast)
         return self._qasm_ast_to_str(self.original_program)
 
     def copy(self):
-        """Return a deep copy of the module"""
-        return deepcopy(self)
+        """Return a deep copy of the module
+
+        Only the program ASTs go through ``deepcopy``, as transformations such as
+        ``reverse_qubit_order`` rewrite AST nodes in place. The remaining bookkeeping
+        state holds flat containers and is copied field by field.
+        """
+        new_module = self.__class__.__new__(self.__class__)
+        new_module.__dict__.update(self.__dict__)
+
+        # a shared memo keeps statement lists that alias each other aliased in the copy
+        memo: dict[int, object] = {}
+        new_module._original_program = deepcopy(self._original_program, memo)
+        new_module._unrolled_ast = deepcopy(self._unrolled_ast, memo)
+        new_module._statements = deepcopy(self._statements, memo)
+
+        new_module._qubit_depths = {key: replace(node) for key, node in self._qubit_depths.items()}
+        new_module._clbit_depths = {key: replace(node) for key, node in self._clbit_depths.items()}
+        new_module._qubit_registers = dict(self._qubit_registers)
+        new_module._classical_registers = dict(self._classical_registers)
+        new_module._external_gates = list(self._external_gates)
+        new_module._user_operations = list(self._user_operations)
+        new_module._extern_functions = dict(self._extern_functions)
+        new_module._depth_cache = dict(self._depth_cache)
+        return new_module
 
     @abstractmethod
     def _qasm_ast_to_str(self, qasm_ast):
@@ -46,13 +46,15 @@ PATTERNS = {
 }
 
 
-def process_include_statements(filename: str) -> str:
+def process_include_statements(filename: str, program: str | None = None) -> str:
     """
     Recursively processes include statements in an OpenQASM file, replacing them with the
     contents of the included files. Handles circular includes and missing files.
 
     Args:
         filename (str): The path to the OpenQASM file to process.
+        program (str | None): The already-read content of ``filename``. If None, the
+            file is read from disk.
 
     Returns:
         str: The fully include-resolved program content.
@@ -64,8 +66,9 @@ def process_include_statements(filename: str) -> str:
     # Generate context for include processing
     ctx = IncludeContext()
 
-    with open(filename, "r", encoding="utf-8") as f:
-        program = f.read()
+    if program is None:
+        with open(filename, "r", encoding="utf-8") as f:
+            program = f.read()
 
     _collect_headers(ctx, program)
 
@@ -74,13 +77,13 @@ def process_include_statements(filename: str) -> str:
         return program
 
     # Recursively process and replace includes in-line
-    result = _process_file(ctx, filename)
+    result = _process_file(ctx, filename, program)
 
     # Return processed file with original header
     return "\n".join(ctx.base_file_header) + "\n\n" + result
 
 
-def _process_file(ctx: IncludeContext, filepath: str) -> str:
+def _process_file(ctx: IncludeContext, filepath: str, program: str | None = None) -> str:
     """
     Process a single file, replacing include statements with the contents of the included files
     recursively.
@@ -88,6 +91,7 @@ def _process_file(ctx: IncludeContext, filepath: str) -> str:
     Args:
         ctx (IncludeContext): The context for processing includes.
         filepath (str): The path to the file to process.
+        program (str | None): The already-read content of ``filepath``, if available.
 
     Returns:
         str: The fully include-resolved program content.
@@ -100,8 +104,9 @@ def _process_file(ctx: IncludeContext, filepath: str) -> str:
     if filename in ctx.visited:
         return ""  # Already processed this file, skip to avoid circular includes
 
-    with open(filepath, "r", encoding="utf-8") as f:
-        program = f.read()
+    if program is None:
+        with open(filepath, "r", encoding="utf-8") as f:
+            program = f.read()
 
     ctx.visited.add(filename)  # Mark as visited to avoid looping
     new_program_lines = []
@@ -16,11 +16,14 @@
 Module with utility functions for QASM visitor
 
 """
+from functools import lru_cache
 from typing import Any, Optional
 
 import numpy as np
 from openqasm3.ast import (
     ArrayType,
+    BitType,
+    BoolType,
     ClassicalDeclaration,
     FloatType,
 )
@@ -31,11 +34,47 @@ from openqasm3.ast import (
     QuantumGateDefinition,
     ReturnStatement,
     SubroutineDefinition,
+    UintType,
 )
 
 from pyqasm.elements import Variable
 from pyqasm.exceptions import ValidationError, raise_qasm3_error
-from pyqasm.maps.expressions import LIMITS_MAP, VARIABLE_TYPE_MAP, qasm_variable_type_cast
+from pyqasm.maps.expressions import (
+    ARRAY_TYPE_MAP,
+    LIMITS_MAP,
+    VARIABLE_TYPE_MAP,
+    qasm_variable_type_cast,
+)
+
+
+@lru_cache(maxsize=None)
+def _value_range(qasm_type: type, base_size: int) -> Optional[tuple[int | float, int | float]]:
+    """Returns the inclusive range of values a variable of the given type and size can hold,
+    or None if the values of the type are not range checked. Cached as only a handful
+    of type and size combinations occur in a program."""
+    type_to_match = VARIABLE_TYPE_MAP.get(qasm_type)
+    if type_to_match == int:
+        # powers of two as shifts, which skip the general integer power routine
+        if qasm_type == Qasm3IntType:
+            return -(1 << (base_size - 1)), (1 << (base_size - 1)) - 1
+        # would be uint only so we correctly get this
+        return 0, (1 << base_size) - 1
+    if type_to_match == float:
+        limit = LIMITS_MAP["float_32"] if base_size == 32 else LIMITS_MAP["float_64"]
+        return -1.0 * limit, limit
+    return None
+
+
+def _raise_out_of_limits(
+    value: Any, var_name: str, base_size: int, op_node: Optional[QASMNode] = None
+) -> None:
+    """Raises the error for a value outside the range of its variable, shared by the
+    scalar and the whole-array checks."""
+    raise_qasm3_error(
+        f"Value {value} out of limits for variable '{var_name}' with base size {base_size}",
+        error_node=op_node,
+        span=op_node.span if op_node else None,
+    )
 
 
 class Qasm3Validator:
@@ -66,33 +105,38 @@ class Qasm3Validator:
         )
 
     @staticmethod
-    def validate_statement_type(blacklisted_stmts: set, statement: Any, construct: str) -> None:
+    def validate_statement_type(
+        blacklisted_stmts: frozenset[type], statement: Any, construct: str
+    ) -> None:
         """Validate the type of a statement.
 
         Args:
-            blacklisted_stmts (set): The set of blacklisted statements.
+            blacklisted_stmts (frozenset[type]): The blacklisted statement types. Statements
+                are matched by their exact type, so these must be concrete node classes.
             statement (Any): The statement to validate.
             construct (str): The construct the statement is in.
 
         Raises:
             ValidationError: If the statement is not supported.
         """
-        stmt_type = statement.__class__
-        if stmt_type in blacklisted_stmts:
-            if stmt_type != ClassicalDeclaration:
-                raise_qasm3_error(
-                    f"Unsupported statement '{stmt_type}' in {construct} block",
-                    error_node=statement,
-                    span=statement.span,
-                )
+        stmt_type = type(statement)
+        if stmt_type not in blacklisted_stmts:
+            return
 
-            if statement.type.__class__ == ArrayType:
-                raise_qasm3_error(
-                    f"Unsupported statement {stmt_type} with {statement.type.__class__}"
-                    f" in {construct} block",
-                    error_node=statement,
-                    span=statement.span,
-                )
+        if stmt_type is not ClassicalDeclaration:
+            raise_qasm3_error(
+                f"Unsupported statement '{stmt_type}' in {construct} block",
+                error_node=statement,
+                span=statement.span,
+            )
+
+        if isinstance(statement.type, ArrayType):
+            raise_qasm3_error(
+                f"Unsupported statement {stmt_type} with {statement.type.__class__}"
+                f" in {construct} block",
+                error_node=statement,
+                span=statement.span,
+            )
 
     @staticmethod
     def validate_variable_type(variable: Optional[Variable], reqd_type: Any) -> bool:
@@ -127,65 +171,63 @@ class Qasm3Validator:
         Returns:
             Any: The value casted to the correct type.
         """
-        # check 1 - type match
-        qasm_type = variable.base_type.__class__
-        base_size = variable.base_size
+        return Qasm3Validator._validate_value(
+            variable.base_type.__class__, variable.base_size, variable.name, value, op_node
+        )
 
+    @staticmethod
+    def _validate_value(
+        qasm_type: type,
+        base_size: int,
+        var_name: str,
+        value: Any,
+        op_node: Optional[QASMNode] = None,
+    ) -> Any:
+        """Validate the assignment of a value to a variable of the given type and size.
+
+        Args:
+            qasm_type (type): The Qasm3 type class of the variable.
+            base_size (int): The base size of the variable.
+            var_name (str): The name of the variable.
+            value (Any): The value to assign.
+            op_node (QASMNode): The operation node, for error reporting.
+
+        Raises:
+            ValidationError: If the value is not of the correct type.
+
+        Returns:
+            Any: The value casted to the correct type.
+        """
+        # check 1 - type match
         try:
             type_to_match = VARIABLE_TYPE_MAP[qasm_type]
         except KeyError as err:
             raise_qasm3_error(
-                f"Invalid type '{qasm_type}' for variable '{variable.name}'",
+                f"Invalid type '{qasm_type}' for variable '{var_name}'",
                 err_type=ValidationError,
                 raised_from=err,
                 error_node=op_node,
                 span=op_node.span if op_node else None,
             )
 
-        # For each type we will have a "castable" type set and its corresponding cast operation
-        type_casted_value = qasm_variable_type_cast(qasm_type, variable.name, base_size, value)
+        # For each type we will have a "castable" type set and its corresponding cast operation.
+        # Values already of the matching Python type cast to themselves, except for uint
+        # values which wrap around to the size of the variable.
+        type_casted_value: Any
+        if value.__class__ is type_to_match and qasm_type is not UintType:
+            type_casted_value = value
+        else:
+            type_casted_value = qasm_variable_type_cast(qasm_type, var_name, base_size, value)
 
-        left: int | float = 0
-        right: int | float = 0
         # check 2 - range match , if bits mentioned in base size
-        if type_to_match == int:
-            base_size = variable.base_size
-            if qasm_type == Qasm3IntType:
-                left, right = (
-                    -1 * (2 ** (base_size - 1)),
-                    2 ** (base_size - 1) - 1,
-                )
-            else:
-                # would be uint only so we correctly get this
-                left, right = 0, 2**base_size - 1
+        value_range = _value_range(qasm_type, base_size)
+        if value_range is not None:
+            left, right = value_range
             if type_casted_value < left or type_casted_value > right:
-                raise_qasm3_error(
-                    f"Value {value} out of limits for variable '{variable.name}' with "
-                    f"base size {base_size}",
-                    error_node=op_node,
-                    span=op_node.span if op_node else None,
-                )
-
-        elif type_to_match == float:
-            base_size = variable.base_size
-
-            if base_size == 32:
-                left, right = -1.0 * (LIMITS_MAP["float_32"]), (LIMITS_MAP["float_32"])
-            else:
-                left, right = -1.0 * (LIMITS_MAP["float_64"]), (LIMITS_MAP["float_64"])
-
-            if type_casted_value < left or type_casted_value > right:
-                raise_qasm3_error(
-                    f"Value {value} out of limits for variable '{variable.name}' with "
-                    f"base size {base_size}",
-                    error_node=op_node,
-                    span=op_node.span if op_node else None,
-                )
-        elif type_to_match in (bool, complex):
-            pass
-        else:
+                _raise_out_of_limits(value, var_name, base_size, op_node)
+        elif type_to_match not in (bool, complex):
             raise_qasm3_error(
-                f"Invalid type {type_to_match} for variable '{variable.name}'",
+                f"Invalid type {type_to_match} for variable '{var_name}'",
                 TypeError,
                 error_node=op_node,
                 span=op_node.span if op_node else None,
@@ -234,6 +276,17 @@ class Qasm3Validator:
         Raises:
             ValidationError: If the values are not of the correct type.
         """
+        if values.shape == tuple(dimensions):
+            if Qasm3Validator._validate_typed_array_values(variable, values):
+                return
+            if values.dtype != object:
+                # every element is a scalar, so they are checked in one flat pass
+                for index, value in np.ndenumerate(values):
+                    values[index] = Qasm3Validator.validate_variable_assignment_value(
+                        variable, value
+                    )
+                return
+
         # recursively check the array
         if values.shape[0] != dimensions[0]:
             raise_qasm3_error(
@@ -251,6 +304,41 @@ class Qasm3Validator:
                     )
                 values[i] = Qasm3Validator.validate_variable_assignment_value(variable, value)
 
+    @staticmethod
+    def _validate_typed_array_values(variable: Variable, values: np.ndarray) -> bool:
+        """Cast and range check all values of an array at once, if the array already
+        holds the numpy dtype of the variable's base type.
+
+        Args:
+            variable (Variable): The variable to assign to.
+            values (np.ndarray[Any]): The values to assign, of the variable's dimensions.
+
+        Raises:
+            ValidationError: If a value is out of range for the variable.
+
+        Returns:
+            bool: True if the values were validated, False if they need to be validated
+                element by element.
+        """
+        qasm_type = variable.base_type.__class__
+        base_size = variable.base_size
+        if values.dtype.type is not ARRAY_TYPE_MAP.get(qasm_type):
+            return False
+
+        if qasm_type == UintType:
+            # uint values wrap around instead of going out of range
+            if base_size < 64:
+                values %= 2**base_size
+            return True
+
+        value_range = _value_range(qasm_type, base_size)
+        if value_range is not None:
+            left, right = value_range
+            out_of_range = (values < left) | (values > right)
+            if out_of_range.any():
+                _raise_out_of_limits(values[out_of_range][0], variable.name, base_size)
+        return True
+
     @staticmethod
     def validate_gate_call(
         operation: QuantumGate,
@@ -307,8 +395,8 @@ class Qasm3Validator:
         Returns:
             Any: The return value casted to the correct type
         """
-
-        if subroutine_def.return_type is None:
+        return_type = subroutine_def.return_type
+        if return_type is None:
             if return_value is not None:
                 raise_qasm3_error(
                     f"Return type mismatch for subroutine '{subroutine_def.name.name}'."
@@ -320,23 +408,20 @@ class Qasm3Validator:
             if return_value is None:
                 raise_qasm3_error(
                     f"Return type mismatch for subroutine '{subroutine_def.name.name}'."
-                    f" Expected {type(subroutine_def.return_type)} but got void",
+                    f" Expected {type(return_type)} but got void",
                     error_node=return_statement,
                     span=return_statement.span,
                 )
-            base_size = 1
-            if hasattr(subroutine_def.return_type, "size"):
-                base_size = subroutine_def.return_type.size.value
-
-            return Qasm3Validator.validate_variable_assignment_value(
-                Variable(
-                    subroutine_def.name.name + "_return",
-                    subroutine_def.return_type,
-                    base_size,
-                    None,
-                    None,
-                    span=return_statement.span,
-                ),
+            # unsized types take the same default sizes as in variable declarations
+            base_size = 1 if isinstance(return_type, (BitType, BoolType)) else 32
+            size = getattr(return_type, "size", None)
+            if size is not None:
+                base_size = size.value
+
+            return Qasm3Validator._validate_value(
+                return_type.__class__,
+                base_size,
+                subroutine_def.name.name + "_return",
                 return_value,
                 op_node=return_statement,
             )
@@ -354,10 +439,8 @@ class Qasm3Validator:
         Returns:
             bool: True if the qubits are unique, False otherwise.
         """
-        if reg_name not in qubit_map:
-            qubit_map[reg_name] = set(indices)
-        else:
-            for idx in indices:
-                if idx in qubit_map[reg_name]:
-                    return False
+        seen_indices = qubit_map.setdefault(reg_name, set())
+        if not seen_indices.isdisjoint(indices):
+            return False
+        seen_indices.update(indices)
         return True
@@ -42,6 +42,13 @@ VALID_FILES = [
 ]
 
 
+@pytest.fixture(autouse=True)
+def cache_home(tmp_path, monkeypatch):
+    """Fixture to keep the validation cache out of the user's home directory."""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    return tmp_path
+
+
 @pytest.fixture
 def runner():
     """Fixture to create a CLI runner."""
@@ -94,6 +101,28 @@ def test_validate_command_with_invalid_file(runner: CliRunner):
     assert "Found errors in 1 file (checked 3 source files)" in result_output
 
 
+def test_validate_command_with_jobs(runner: CliRunner):
+    """Test the `validate` CLI command using multiple worker processes."""
+    result = runner.invoke(app, ["validate", RESOURCE_DIR, "--jobs", "2"])
+
+    assert result.exit_code == 1
+
+    result_output = normalize_output(result.output)
+    assert f"{INVALID_FILE}: error:" in result_output
+    assert "Found errors in 1 file (checked 3 source files)" in result_output
+
+
+def test_validate_command_with_overlapping_paths(runner: CliRunner):
+    """Test that files reachable through several source paths are validated once."""
+    result = runner.invoke(app, ["validate", RESOURCE_DIR, INVALID_FILE, *VALID_FILES])
+
+    assert result.exit_code == 1
+
+    result_output = normalize_output(result.output)
+    assert result_output.count(f"{INVALID_FILE}: error:") == 1
+    assert "Found errors in 1 file (checked 3 source files)" in result_output
+
+
 def test_validate_command_with_skip_file(runner: CliRunner):
     """Test the `validate` CLI command skipping invalid files."""
     result = runner.invoke(app, ["validate", RESOURCE_DIR, "--skip", INVALID_FILE])
@@ -104,6 +133,44 @@ def test_validate_command_with_skip_file(runner: CliRunner):
     assert f"Success: no issues found in {len(VALID_FILES)} source files" in result_output
 
 
+@pytest.mark.parametrize("tag", ["// pyqasm disable: validate", "// pyqasm: ignore"])
+def test_validate_command_with_skip_tag(runner: CliRunner, tag):
+    """Test the `validate` CLI command skipping files with a skip tag in their header."""
+    tagged_dir = os.path.join(RESOURCE_DIR, "tagged")
+    os.makedirs(tagged_dir, exist_ok=True)
+
+    try:
+        with open(INVALID_FILE, "r") as src:
+            content = src.read()
+        with open(os.path.join(tagged_dir, "invalid1.qasm"), "w") as dst:
+            dst.write(f"{tag}\n{content}")
+        shutil.copy(VALID_FILES[0], os.path.join(tagged_dir, "valid1.qasm"))
+
+        result = runner.invoke(app, ["validate", tagged_dir])
+
+        assert result.exit_code == 0
+        result_output = result.output.replace("\n", "")
+        assert "Skipped 1 file" in result_output
+        assert "Success: no issues found in 1 source file" in result_output
+    finally:
+        shutil.rmtree(tagged_dir, ignore_errors=True)
+
+
+@pytest.mark.parametrize("newline", ["\r", "\r\n", "\n"])
+def test_validate_command_ignores_skip_tag_after_version(runner: CliRunner, tmp_path, newline):
+    """Test that skip tags after the OPENQASM line are ignored for any line ending."""
+    program = newline.join(
+        ["OPENQASM 3.0;", "// pyqasm disable: validate", "qubit[1] q;", "h q[2];", ""]
+    )
+    tagged_file = tmp_path / "invalid.qasm"
+    tagged_file.write_bytes(program.encode("utf-8"))
+
+    result = runner.invoke(app, ["validate", str(tagged_file)])
+
+    assert result.exit_code == 1
+    assert "Found errors in 1 file" in result.output.replace("\n", "")
+
+
 def test_validate_command_with_only_valid_files(runner: CliRunner):
     """Test the `validate` CLI command with only valid files."""
     valid_only_dir = os.path.join(RESOURCE_DIR, "valid")
@@ -128,6 +195,92 @@ def test_validate_command_with_only_valid_files(runner: CliRunner):
         shutil.rmtree(valid_only_dir, ignore_errors=True)
 
 
+def test_validate_command_nested_directories(runner: CliRunner):
+    """Test the `validate` CLI command discovers .qasm files in nested directories."""
+    nested_dir = os.path.join(RESOURCE_DIR, "nested")
+    deep_dir = os.path.join(nested_dir, "a", "b")
+    os.makedirs(deep_dir, exist_ok=True)
+
+    try:
+        shutil.copy(VALID_FILES[0], os.path.join(nested_dir, "valid1.qasm"))
+        shutil.copy(VALID_FILES[1], os.path.join(deep_dir, "valid2.qasm"))
+        with open(os.path.join(deep_dir, "notes.txt"), "w") as f:
+            f.write("not a qasm file")
+
+        result = runner.invoke(app, ["validate", nested_dir])
+
+        assert result.exit_code == 0
+        assert "Success: no issues found in 2 source files" in result.output.replace("\n", "")
+    finally:
+        shutil.rmtree(nested_dir, ignore_errors=True)
+
+
+def test_validate_command_no_recursive_and_pruned_dirs(runner: CliRunner):
+    """Test that nested and pruned directories are not searched when expected."""
+    top_dir = os.path.join(RESOURCE_DIR, "flat")
+    nested_dir = os.path.join(top_dir, "nested")
+    pruned_dir = os.path.join(top_dir, ".git")
+    os.makedirs(nested_dir, exist_ok=True)
+    os.makedirs(pruned_dir, exist_ok=True)
+
+    try:
+        shutil.copy(VALID_FILES[0], os.path.join(top_dir, "valid1.qasm"))
+        shutil.copy(VALID_FILES[1], os.path.join(nested_dir, "valid2.qasm"))
+        shutil.copy(INVALID_FILE, os.path.join(pruned_dir, "invalid1.qasm"))
+
+        result = runner.invoke(app, ["validate", top_dir])
+        assert result.exit_code == 0
+        assert "Success: no issues found in 2 source files" in result.output.replace("\n", "")
+
+        result = runner.invoke(app, ["validate", top_dir, "--no-recursive"])
+        assert result.exit_code == 0
+        assert "Success: no issues found in 1 source file" in result.output.replace("\n", "")
+    finally:
+        shutil.rmtree(top_dir, ignore_errors=True)
+
+
+@pytest.mark.skipif(not hasattr(os, "symlink"), reason="symlinks not supported")
+def test_validate_command_symlinked_file(runner: CliRunner):
+    """Test that symlinked .qasm files in a directory are validated."""
+    link_dir = os.path.join(RESOURCE_DIR, "links")
+    os.makedirs(link_dir, exist_ok=True)
+
+    try:
+        os.symlink(INVALID_FILE, os.path.join(link_dir, "invalid1.qasm"))
+
+        result = runner.invoke(app, ["validate", link_dir])
+
+        assert result.exit_code == 1
+        assert "Found errors in 1 file" in result.output.replace("\n", "")
+    finally:
+        shutil.rmtree(link_dir, ignore_errors=True)
+
+
+def test_validate_command_unreadable_directory(runner: CliRunner, monkeypatch):
+    """Test that directories which cannot be listed are skipped."""
+    top_dir = os.path.join(RESOURCE_DIR, "locked_parent")
+    locked_dir = os.path.join(top_dir, "locked")
+    os.makedirs(locked_dir, exist_ok=True)
+    scandir = os.scandir
+
+    def failing_scandir(path):
+        if path == locked_dir:
+            raise PermissionError(13, "Permission denied", path)
+        return scandir(path)
+
+    try:
+        shutil.copy(VALID_FILES[0], os.path.join(top_dir, "valid1.qasm"))
+        shutil.copy(INVALID_FILE, os.path.join(locked_dir, "invalid1.qasm"))
+        monkeypatch.setattr(os, "scandir", failing_scandir)
+
+        result = runner.invoke(app, ["validate", top_dir])
+
+        assert result.exit_code == 0
+        assert "Success: no issues found in 1 source file" in result.output.replace("\n", "")
+    finally:
+        shutil.rmtree(top_dir, ignore_errors=True)
+
+
 def test_validate_command_no_files(runner: CliRunner):
     """Test the `validate` CLI command with no files provided."""
     empty_dir = os.path.join(CLI_TESTS_DIR, "resources", "empty")
@@ -142,6 +295,75 @@ def test_validate_command_no_files(runner: CliRunner):
         shutil.rmtree(empty_dir, ignore_errors=True)
 
 
+def test_validate_command_uses_cache(runner: CliRunner, cache_home, monkeypatch):
+    """Test that programs validated in a previous run are not parsed again."""
+    result = runner.invoke(app, ["validate", RESOURCE_DIR])
+    assert result.exit_code == 1
+    assert not os.path.exists(os.path.join(cache_home, "pyqasm", "validate-cache"))
+
+    result = runner.invoke(app, ["validate", RESOURCE_DIR, "--cache"])
+    assert result.exit_code == 1
+
+    with open(os.path.join(cache_home, "pyqasm", "validate-cache"), "r") as f:
+        assert len(f.read().splitlines()) == len(VALID_FILES)
+
+    def fail_loads(*args, **kwargs):
+        raise AssertionError("cached program should not be loaded")
+
+    monkeypatch.setattr("pyqasm.cli.validate.loads", fail_loads)
+    result = runner.invoke(app, ["validate", *VALID_FILES, "--cache"])
+    assert result.exit_code == 0
+    assert f"Success: no issues found in {len(VALID_FILES)} source files" in result.output
+
+    result = runner.invoke(app, ["validate", *VALID_FILES])
+    assert result.exit_code == 1
+
+
+def test_validate_cache_records_each_program_once(runner: CliRunner, cache_home, tmp_path):
+    """Test that identical programs validated in one run are recorded in the cache once."""
+    copies_dir = tmp_path / "copies"
+    copies_dir.mkdir()
+    for name in ("a.qasm", "b.qasm"):
+        shutil.copy(VALID_FILES[0], copies_dir / name)
+
+    for _ in range(2):
+        result = runner.invoke(app, ["validate", str(copies_dir), "--cache"])
+        assert result.exit_code == 0
+
+    with open(os.path.join(cache_home, "pyqasm", "validate-cache"), "r") as f:
+        assert len(f.read().splitlines()) == 1
+
+
+def test_validate_cache_drops_stale_entries(runner: CliRunner, cache_home):
+    """Test that cache entries recorded under another cache key are pruned on load."""
+    cache_file = os.path.join(cache_home, "pyqasm", "validate-cache")
+    os.makedirs(os.path.dirname(cache_file))
+    with open(cache_file, "w") as f:
+        f.write("v0/0.0.0 0123456789abcdef\n")
+
+    result = runner.invoke(app, ["validate", *VALID_FILES, "-j", "2", "--cache"])
+    assert result.exit_code == 0
+
+    with open(cache_file, "r") as f:
+        lines = f.read().splitlines()
+    assert len(lines) == len(VALID_FILES)
+    assert not any(line.startswith("v0/") for line in lines)
+
+
+def test_validate_cache_key_tracks_parser_version(monkeypatch):
+    """Test that the cache key changes when a parser dependency is upgraded."""
+    from pyqasm.cli import validate
+
+    validate._cache_key.cache_clear()
+    key = validate._cache_key()
+    monkeypatch.setattr(validate, "_installed_version", lambda distribution: "0.0.0")
+    validate._cache_key.cache_clear()
+    try:
+        assert validate._cache_key() != key
+    finally:
+        validate._cache_key.cache_clear()
+
+
 def test_main_version_flag(runner: CliRunner):
     """Test the `--version` flag of the CLI."""
     result = runner.invoke(app, ["--version"])
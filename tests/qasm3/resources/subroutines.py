@@ -256,6 +256,23 @@ SUBROUTINE_INCORRECT_TESTS = {
         8,
         "my_function(q[0:3], q[2])",
     ),
+    "test_duplicate_qubit_args_after_distinct_args": (
+        """
+        OPENQASM 3;
+        include "stdgates.inc";
+
+        def my_function(qubit a, qubit b, qubit c) {
+            h a;
+            return;
+        }
+        qubit[2] q;
+        my_function(q[0], q[1], q[1]);
+        """,
+        r"Duplicate qubit argument for register 'q' in function call for 'my_function'",
+        10,
+        8,
+        "my_function(q[0], q[1], q[1])",
+    ),
     "undefined_variable_in_actual_arg_1": (
         """
         OPENQASM 3;
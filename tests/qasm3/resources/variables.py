@@ -206,6 +206,18 @@ DECLARATION_TESTS = {
         8,
         "array[int[32], 3, 1, 2] x = {1, 2, 3};",
     ),
+    "array_value_out_of_range": (
+        """
+        OPENQASM 3.0;
+        include "stdgates.inc";
+
+        array[int[8], 2, 2] x = {{1, 2}, {3, 300}};
+        """,
+        "Invalid initialization value for array 'x'",
+        5,
+        8,
+        "array[int[8], 2, 2] x = {{1, 2}, {3, 300}};",
+    ),
     "invalid_bit_type_array_1": (
         """
         OPENQASM 3.0;
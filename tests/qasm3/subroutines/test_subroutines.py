@@ -219,6 +219,29 @@ def test_function_call_with_return():
     check_single_qubit_gate_op(result.unrolled_ast, 1, [0], "h")
 
 
+@pytest.mark.parametrize(
+    "return_type, return_value", [("int", "5"), ("uint", "5"), ("float", "2.5"), ("bit", "1")]
+)
+def test_function_call_with_unsized_return_type(return_type, return_value):
+    """Test that functions returning unsized types use the default size of the type."""
+    qasm_str = f"""OPENQASM 3.0;
+    include "stdgates.inc";
+
+    def my_function(qubit q) -> {return_type} {{
+        h q;
+        return {return_value};
+    }}
+    qubit q;
+    {return_type} r = my_function(q);
+    """
+
+    result = loads(qasm_str)
+    result.unroll()
+    assert result.num_qubits == 1
+
+    check_single_qubit_gate_op(result.unrolled_ast, 1, [0], "h")
+
+
 def test_return_values_from_function():
     """Test that the values returned from a function are used correctly in other function."""
     qasm_str = """OPENQASM 3.0;
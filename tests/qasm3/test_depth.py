@@ -294,6 +294,50 @@ def test_after_removing_barriers():
     assert result_copy_2.depth() == 3
 
 
+def test_depth_is_cached_until_program_changes(monkeypatch):
+    qasm3_string = """
+    OPENQASM 3;
+    include "stdgates.inc";
+    qubit[2] q;
+    h q;
+    barrier q;
+    cx q[0], q[1];
+    """
+    result = loads(qasm3_string)
+    result.unroll()
+    assert result.depth() == 3
+
+    def fail_unroll(self, **kwargs):
+        raise AssertionError("depth was recalculated for an unchanged program")
+
+    with monkeypatch.context() as m:
+        m.setattr(type(result), "unroll", fail_unroll)
+        assert result.depth() == 3
+
+    result.remove_barriers()
+    assert result.depth() == 2
+
+
+def test_depth_leaves_module_unchanged():
+    qasm3_string = """
+    OPENQASM 3;
+    include "stdgates.inc";
+    qubit[2] q;
+    qubit r;
+    h q;
+    cx q[0], r;
+    """
+    result = loads(qasm3_string)
+    program_str = str(result)
+    history = list(result.history)
+
+    assert result.depth() == 2
+    assert str(result) == program_str
+    assert result.history == history + ["depth(decompose_native_gates=True)"]
+    assert result._qubit_depths == {}
+    assert result._num_qubits == -1
+
+
 def test_qasm3_depth_sparse_operations():
     """Test calculating depth of qasm3 circuit with sparse operations"""
     qasm_string = """
@@ -73,3 +73,9 @@ def test_incorrect_module_unroll_raises_error():
     with pytest.raises(ValidationError):
         module = loads("OPENQASM 3.0;\n qubit q; h q[2]")
         module.unroll()
+
+
+def test_module_dump_after_unroll_to_single_statement():
+    module = loads("OPENQASM 3.0;\n const int n = 2;\n qubit[n] q;")
+    module.unroll()
+    check_unrolled_qasm(dumps(module), "OPENQASM 3.0;\n qubit[2] q;")
@@ -281,3 +281,25 @@ def test_incorrect_measure(qasm3_code, error_message, line_num, col_num, err_lin
 
     assert f"Error at line {line_num}, column {col_num}" in caplog.text
     assert err_line in caplog.text
+
+
+def test_has_measurements_updates_after_unroll():
+    """Test that has_measurements is re-evaluated once the module is unrolled."""
+    qasm3_string = """
+    OPENQASM 3.0;
+
+    qubit[2] q;
+    bit[2] c;
+
+    for int i in [0:1] {
+        c[i] = measure q[i];
+    }
+    """
+    module = loads(qasm3_string)
+    assert not module.has_measurements()
+
+    module.unroll()
+    assert module.has_measurements()
+
+    module.remove_measurements()
+    assert not module.has_measurements()
@@ -20,8 +20,9 @@ import os
 
 import pytest
 
-from pyqasm.entrypoint import dumps, load
+from pyqasm.entrypoint import dumps, load, loads
 from pyqasm.exceptions import ValidationError
+from pyqasm.preprocess import process_include_statements
 from tests.utils import check_unrolled_qasm
 
 QASM_RESOURCES_DIR = os.path.join(
@@ -59,6 +60,16 @@ def test_valid_include_processing(test_file, ref_file):
     check_unrolled_qasm(dumps(module), dumps(ref_module))
 
 
+def test_include_processing_with_preloaded_content():
+    """Test that include processing gives the same result when passed the file content."""
+    file_path = os.path.join(QASM_RESOURCES_DIR, "include_nested.qasm")
+    with open(file_path, "r", encoding="utf-8") as f:
+        content = f.read()
+
+    module = loads(process_include_statements(file_path, content))
+    check_unrolled_qasm(dumps(module), dumps(load(file_path)))
+
+
 def test_include_file_not_found():
     """Test that missing include files raise FileNotFoundError."""
     file_path = os.path.join(QASM_RESOURCES_DIR, "inc_not_found.qasm")
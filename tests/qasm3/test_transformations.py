@@ -218,3 +218,96 @@ def test_populate_idle_qubits_increases_depth_by_one():
     original_depth = module.depth()
     module.populate_idle_qubits()
     assert module.depth() == original_depth + 1
+
+
+def test_transformations_on_copy_leave_original_unchanged():
+    """Test that transformations with in_place=False do not modify the original module"""
+    qasm3_str = """
+    OPENQASM 3.0;
+    include "stdgates.inc";
+    qubit[3] q;
+    bit[1] c;
+
+    cx q[0], q[1];
+    c[0] = measure q[0];
+    """
+
+    module = loads(qasm3_str)
+    module.unroll()
+    unrolled_qasm = dumps(module)
+    qubit_depths = {key: node.depth for key, node in module._qubit_depths.items()}
+
+    reversed_module = module.reverse_qubit_order(in_place=False)
+    trimmed_module = module.remove_idle_qubits(in_place=False)
+    module.remove_measurements(in_place=False)
+
+    check_unrolled_qasm(dumps(module), unrolled_qasm)
+    assert {key: node.depth for key, node in module._qubit_depths.items()} == qubit_depths
+    assert reversed_module._qubit_depths is not module._qubit_depths
+    assert trimmed_module._qubit_registers == {"q": 2}
+    assert module._qubit_registers == {"q": 3}
+
+
+def test_remove_idle_qubits_remaps_qubit_depths():
+    """Test that the depth map is re-keyed to the new indices after removing idle qubits"""
+    qasm3_str = """
+    OPENQASM 3.0;
+    include "stdgates.inc";
+    qubit[4] q;
+
+    h q[0];
+    x q[2];
+    cx q[2], q[3];
+    """
+
+    module = loads(qasm3_str)
+    module.remove_idle_qubits()
+
+    assert sorted(module._qubit_depths) == [("q", 0), ("q", 1), ("q", 2)]
+    assert all(node.reg_index == idx for (_, idx), node in module._qubit_depths.items())
+    assert [module._qubit_depths[("q", idx)].depth for idx in range(3)] == [1, 2, 2]
+
+
+def test_populate_idle_qubits_without_idle_qubits_keeps_statements():
+    """Test that populating a module without idle qubits leaves its statements untouched"""
+    qasm3_str = """
+    OPENQASM 3.0;
+    include "stdgates.inc";
+    qubit[2] q;
+    bit[2] c;
+
+    h q;
+    c = measure q;
+    """
+
+    module = loads(qasm3_str)
+    module.remove_measurements()
+    statements = module._statements
+
+    module.populate_idle_qubits()
+
+    assert module._statements is statements
+    assert not module.has_measurements()
+
+
+def test_remove_idle_qubits_not_in_place_keeps_original_qubit_count():
+    """Test that removing idle qubits from a copy does not change the original module"""
+    qasm3_str = """
+    OPENQASM 3.0;
+    include "stdgates.inc";
+    qubit[2] q;
+    qubit[3] q2;
+    qubit q3;
+
+    h q[0];
+    x q2[1];
+    """
+
+    module = loads(qasm3_str)
+    module.unroll()
+
+    trimmed_module = module.remove_idle_qubits(in_place=False)
+
+    assert module.num_qubits == 6
+    assert trimmed_module.num_qubits == 2
+    assert trimmed_module._qubit_registers == {"q": 1, "q2": 1}